@@ -5,7 +5,48 @@ This module provides the FlexDict class which enhances Python's built-in dict
 with user-friendly features similar to addict or easydict libraries.
 """
 
-from typing import Any, Dict, Iterator, Union
+import copy
+import sys
+from typing import Any, Dict, Iterator, Tuple, Union
+
+
+# Unbound C-level dict slots, called directly on hot paths to skip Python
+# method dispatch through the FlexDict MRO.
+_DGET = dict.__getitem__
+_DSET = dict.__setitem__
+_DGET_OR = dict.get
+
+# Sentinel for lookups where None is a legitimate stored value.
+_MISSING = object()
+
+# Leaf types copy.deepcopy treats as atomic; __deepcopy__ shares them by
+# reference without going through deepcopy's dispatch. (frozenset is left out:
+# its hashable elements may still be mutable objects that deepcopy clones.)
+_IMMUTABLE_TYPES = frozenset({
+    str, int, float, bool, complex, type(None), bytes, range, type,
+})
+
+
+def _is_unwrapped_dict(value: Any) -> bool:
+    """Return True for a dict (or dict subclass) that isn't a FlexDict yet."""
+    # Plain dicts are the common case, so test the exact type before
+    # falling back to isinstance
+    t = type(value)
+    return t is dict or (
+        t is not FlexDict
+        and isinstance(value, dict)
+        and not isinstance(value, FlexDict)
+    )
+
+
+def _wrap_value(value: Any) -> Any:
+    """Return ``value`` converted to a FlexDict if it is a non-FlexDict dict."""
+    return FlexDict(value) if _is_unwrapped_dict(value) else value
+
+
+def _intern(name: str) -> str:
+    """Intern attribute names stored as keys so later lookups compare by identity."""
+    return sys.intern(name) if type(name) is str else name
 
 
 class FlexDict(dict):
@@ -29,6 +70,10 @@ class FlexDict(dict):
         >>> fd3 = FlexDict({"city": "New York", "country": "USA"})
     """
 
+    # Attributes are dict keys, so instances never need a __dict__; keep
+    # __weakref__ so FlexDicts stay weak-referenceable like plain subclasses
+    __slots__ = ("__weakref__",)
+
     def __init__(self, *args, **kwargs):
         """
         Initialize a FlexDict object.
@@ -43,12 +88,101 @@ class FlexDict(dict):
             >>> FlexDict(name="John", age=40)  # From keyword arguments
         """
         # Call parent dict constructor
-        super().__init__(*args, **kwargs)
+        dict.__init__(self, *args, **kwargs)
+        if not self:
+            return
+        
+        # Convert nested dictionaries to FlexDict objects depth-first with an
+        # explicit stack of item iterators (no Python frame per nesting level).
+        # Only the source dicts on the current path are memoized: that is
+        # enough to turn a cycle back into a cycle, while a dict that merely
+        # appears twice still becomes two independent FlexDicts.
+        ancestors: Dict[int, FlexDict] = {}
+        stack = [(self, None, iter(list(dict.items(self))))]
+        while stack:
+            node, source_id, items = stack[-1]
+            for key, value in items:
+                if _is_unwrapped_dict(value):
+                    child = ancestors.get(id(value))
+                    if child is None:
+                        child = ancestors[id(value)] = FlexDict.__new__(FlexDict)
+                        dict.__init__(child, value)
+                        _DSET(node, key, child)
+                        stack.append((child, id(value), iter(list(dict.items(child)))))
+                        break
+                    _DSET(node, key, child)
+            else:
+                stack.pop()
+                if source_id is not None:
+                    del ancestors[source_id]
+
+    @classmethod
+    def from_flat(cls, mapping: Dict[str, Any], sep: str = '.') -> 'FlexDict':
+        """
+        Create a FlexDict from a mapping with flat, separator-joined keys.
+        
+        The nested structure is assembled from plain dicts first and wrapped
+        once at the end, which is cheaper than a chain of dot-notation
+        assignments per key.
         
-        # Convert any nested dictionaries to FlexDict objects
-        for key, value in self.items():
-            if isinstance(value, dict) and not isinstance(value, FlexDict):
-                self[key] = FlexDict(value)
+        Dict values are merged with keys nested under the same path, in either
+        order, so ``{"a.b": 1, "a": {"c": 2}}`` gives ``{"a": {"b": 1, "c": 2}}``.
+        
+        Args:
+            mapping: Mapping of dotted keys (e.g. ``"db.host"``) to values
+            sep: Separator between key components
+            
+        Returns:
+            A new nested FlexDict
+            
+        Raises:
+            ValueError: If a key descends through an existing non-dict value, or
+                a non-dict value would replace keys nested under it
+            
+        Examples:
+            >>> FlexDict.from_flat({"db.host": "localhost", "db.port": 5432})
+            FlexDict({'db': FlexDict({'host': 'localhost', 'port': 5432})})
+        """
+        root: Dict[str, Any] = {}
+        # Dicts built here may be filled in place; dicts supplied as values
+        # are copied before being merged into so the input isn't mutated
+        owned = {id(root)}
+        for key, value in mapping.items():
+            *path, leaf = key.split(sep)
+            node = root
+            for part in path:
+                child = node.get(part, _MISSING)
+                if child is _MISSING:
+                    child = node[part] = {}
+                    owned.add(id(child))
+                elif not isinstance(child, dict):
+                    raise ValueError(
+                        f"Key {key!r} conflicts with non-dict value at {part!r}"
+                    )
+                elif id(child) not in owned:
+                    child = node[part] = dict(child)
+                    owned.add(id(child))
+                node = child
+            # Dict values merge into what dotted keys already built (and vice
+            # versa), so the result doesn't depend on the order of the keys
+            pending = [(node, leaf, value)]
+            while pending:
+                target, name, item = pending.pop()
+                existing = target.get(name, _MISSING)
+                if isinstance(existing, dict) and isinstance(item, dict):
+                    if id(existing) not in owned:
+                        existing = target[name] = dict(existing)
+                        owned.add(id(existing))
+                    pending.extend(
+                        (existing, k, v) for k, v in reversed(list(item.items()))
+                    )
+                elif id(existing) in owned:
+                    raise ValueError(
+                        f"Key {key!r} would overwrite nested keys at {name!r}"
+                    )
+                else:
+                    target[name] = item
+        return cls(root)
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -64,19 +198,20 @@ class FlexDict(dict):
             AttributeError: If the name conflicts with private attributes
         """
         # Prevent access to private attributes
-        if name.startswith('_'):
+        if name[:1] == '_':
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         
-        # Allow access to dict methods normally
-        if hasattr(dict, name):
-            return getattr(dict, name).__get__(self, type(self))
+        # Allow access to dict/FlexDict methods normally
+        if name in _RESERVED:
+            return dict.__getattribute__(self, name)
         
-        try:
-            return self[name]
-        except KeyError:
+        # A sentinel lookup keeps auto-creation off the exception path
+        value = _DGET_OR(self, name, _MISSING)
+        if value is _MISSING:
             # Create a new FlexDict for missing keys (like addict behavior)
-            self[name] = FlexDict()
-            return self[name]
+            value = FlexDict()
+            _DSET(self, _intern(name), value)
+        return value
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
@@ -89,14 +224,12 @@ class FlexDict(dict):
         Raises:
             AttributeError: If trying to set dict methods or private attributes
         """
-        # Prevent setting dict methods or private attributes
-        if name.startswith('_') or hasattr(dict, name):
+        # Prevent setting method names or private attributes
+        if name[:1] == '_' or name in _RESERVED:
             raise AttributeError(f"'{type(self).__name__}' object attribute '{name}' is read-only")
         else:
-            # Convert dict values to FlexDict
-            if isinstance(value, dict) and not isinstance(value, FlexDict):
-                value = FlexDict(value)
-            self[name] = value
+            # Same storage rules as item assignment
+            self[_intern(name)] = value
 
     def __delattr__(self, name: str) -> None:
         """
@@ -108,7 +241,7 @@ class FlexDict(dict):
         Raises:
             AttributeError: If the attribute doesn't exist or is a dict method
         """
-        if name.startswith('_') or hasattr(dict, name):
+        if name[:1] == '_' or name in _RESERVED:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         
         try:
@@ -125,9 +258,7 @@ class FlexDict(dict):
             value: The value to set
         """
         # Convert nested dictionaries to FlexDict objects
-        if isinstance(value, dict) and not isinstance(value, FlexDict):
-            value = FlexDict(value)
-        super().__setitem__(key, value)
+        _DSET(self, key, _wrap_value(value))
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> 'FlexDict':
         """
@@ -139,8 +270,50 @@ class FlexDict(dict):
         Returns:
             A deep copy of this FlexDict
         """
-        import copy
-        return FlexDict({key: copy.deepcopy(value, memo) for key, value in self.items()})
+        new = FlexDict.__new__(type(self))
+        memo[id(self)] = new
+        # Nested FlexDicts are cloned on an explicit stack rather than through
+        # copy.deepcopy's dispatch; other values still go through deepcopy.
+        stack = [(self, new)]
+        while stack:
+            source, target = stack.pop()
+            for key, value in dict.items(source):
+                if type(value) in _IMMUTABLE_TYPES:
+                    pass
+                elif type(value) is FlexDict or isinstance(value, FlexDict):
+                    clone = memo.get(id(value))
+                    if clone is None:
+                        clone = memo[id(value)] = FlexDict.__new__(type(value))
+                        stack.append((value, clone))
+                    value = clone
+                else:
+                    value = copy.deepcopy(value, memo)
+                # Copied children are already FlexDicts, so skip __setitem__
+                _DSET(target, key, value)
+        return new
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Support for pickle and copy.copy().
+        
+        The contents travel as a single plain-dict state that __setstate__
+        restores with one dict.update, instead of one __setitem__ call per
+        key. Reconstruction still goes through the object memo, so
+        self-references survive a round trip.
+        
+        Returns:
+            A (callable, args, state) reduce tuple
+        """
+        return (self.__class__, (), dict(self))
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        """
+        Restore contents produced by __reduce__.
+        
+        Args:
+            state: Plain dict of this FlexDict's items (children already FlexDicts)
+        """
+        dict.update(self, state)
 
     def __repr__(self) -> str:
         """
@@ -152,8 +325,8 @@ class FlexDict(dict):
         if not self:
             return "FlexDict()"
         
-        items = [f"{repr(k)}: {repr(v)}" for k, v in self.items()]
-        return f"FlexDict({{{', '.join(items)}}})"
+        # dict's C repr walks the items (and guards against cycles) for us
+        return "FlexDict(" + dict.__repr__(self) + ")"
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -162,14 +335,79 @@ class FlexDict(dict):
         Returns:
             A regular dictionary with all nested FlexDicts converted to dicts
         """
-        result = {}
-        for key, value in self.items():
-            if isinstance(value, FlexDict):
-                result[key] = value.to_dict()
+        # Copy each level wholesale with the C-level dict() constructor, then
+        # replace nested FlexDicts depth-first with an explicit stack of item
+        # iterators (no recursion). As in __init__, only the FlexDicts on the
+        # current path are memoized: cycles come out as cycles, while a child
+        # stored under two keys still becomes two independent dicts.
+        result = dict(self)
+        ancestors = {id(self): result}
+        stack = [(result, id(self), iter(list(result.items())))]
+        while stack:
+            node, source_id, items = stack[-1]
+            for key, value in items:
+                t = type(value)
+                if t is FlexDict or (t is not dict and isinstance(value, FlexDict)):
+                    child = ancestors.get(id(value))
+                    if child is None:
+                        child = ancestors[id(value)] = dict(value)
+                        node[key] = child
+                        stack.append((child, id(value), iter(list(child.items()))))
+                        break
+                    node[key] = child
             else:
-                result[key] = value
+                stack.pop()
+                del ancestors[source_id]
         return result
 
+    def freeze(self) -> 'FlexDict':
+        """
+        Stop attribute access from auto-creating missing keys.
+        
+        After freezing, reading a missing attribute raises AttributeError
+        instead of inserting a new FlexDict, so dot-access is a pure read.
+        This makes it safe to pull plain values out of a FlexDict before
+        handing them to code that must not mutate it (e.g. a JIT-compiled
+        function). Nested FlexDicts are frozen as well, including dicts
+        assigned into the frozen tree later.
+        
+        Only plain FlexDicts can be frozen: freezing swaps each node's class,
+        which a user subclass of FlexDict doesn't allow.
+        
+        Returns:
+            This FlexDict, frozen in place
+            
+        Raises:
+            TypeError: If this FlexDict or a nested one is a FlexDict subclass;
+                nothing is frozen in that case
+            
+        Examples:
+            >>> cfg = FlexDict({"solver": {"tol": 1e-6}}).freeze()
+            >>> tol = cfg.solver.tol  # extract primitives, then call the kernel
+        """
+        # Collect and check every node before swapping any class, so an
+        # unfreezable subclass leaves the whole tree untouched
+        nodes = []
+        seen = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if type(node) is not FlexDict and type(node) is not _FrozenFlexDict:
+                raise TypeError(
+                    f"cannot freeze {type(node).__name__!r}: "
+                    "only FlexDict instances can be frozen"
+                )
+            nodes.append(node)
+            for value in dict.values(node):
+                if isinstance(value, FlexDict) and type(value) is not _FrozenFlexDict:
+                    stack.append(value)
+        for node in nodes:
+            object.__setattr__(node, "__class__", _FrozenFlexDict)
+        return self
+
     def update(self, *args, **kwargs) -> None:
         """
         Update the FlexDict with key-value pairs, converting dicts to FlexDicts.
@@ -178,16 +416,58 @@ class FlexDict(dict):
             *args: Positional arguments (dict-like objects or iterables of pairs)
             **kwargs: Keyword arguments for additional key-value pairs
         """
-        # Handle positional arguments
-        if args:
-            other = args[0]
-            if hasattr(other, "items"):
-                for key, value in other.items():
-                    self[key] = value
-            else:
-                for key, value in other:
-                    self[key] = value
+        # Gather every argument form into one plain dict (built in C), wrap
+        # its dict values in a single pass, then merge with one dict.update
+        if (len(args) == 1 and not hasattr(args[0], "keys")
+                and hasattr(args[0], "items")):
+            # dict() only accepts mappings with keys(); keep taking items()-only objects
+            args = (args[0].items(),)
+        other = dict(*args, **kwargs)
+        for key, value in other.items():
+            if _is_unwrapped_dict(value):
+                other[key] = FlexDict(value)
+        dict.update(self, other)
+
+
+# Public method names of FlexDict (and dict) that can't be used as dot-notation
+# keys; a frozenset membership test avoids an attribute walk on every access.
+_RESERVED = frozenset(name for name in dir(FlexDict) if name[:1] != '_')
+
+
+def _frozen_value(value: Any) -> Any:
+    """Wrap a dict value as a FlexDict if needed and freeze it."""
+    value = _wrap_value(value)
+    if isinstance(value, FlexDict):
+        value.freeze()
+    return value
+
+
+class _FrozenFlexDict(FlexDict):
+    """FlexDict variant whose attribute reads never mutate; see FlexDict.freeze()."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name[:1] == '_':
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        if name in _RESERVED:
+            return dict.__getattribute__(self, name)
         
-        # Handle keyword arguments
-        for key, value in kwargs.items():
-            self[key] = value
\ No newline at end of file
+        try:
+            return _DGET(self, name)
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+
+    # Children added after freezing are frozen too, so a typo below them
+    # can't silently auto-create a key either. Values are frozen before they
+    # are stored, so one that can't be frozen leaves this FlexDict unchanged.
+    # FlexDict.__setattr__ stores through __setitem__, so it's covered too.
+    def __setitem__(self, key: str, value: Any) -> None:
+        FlexDict.__setitem__(self, key, _frozen_value(value))
+
+    def update(self, *args, **kwargs) -> None:
+        staged = FlexDict()
+        FlexDict.update(staged, *args, **kwargs)
+        staged.freeze()
+        dict.update(self, staged)
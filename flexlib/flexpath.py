@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import io
 import os
 import shutil
@@ -8,12 +9,74 @@ import glob as _glob
 import pwd as _pwd
 import grp as _grp
 import fnmatch as _fnmatch
+from os import fspath as _fspath
+from os.path import (
+    abspath as _abspath,
+    commonpath as _commonpath,
+    dirname as _dirname,
+    exists as _exists,
+    expanduser as _expanduser,
+    isabs as _isabs,
+    isdir as _isdir,
+    isfile as _isfile,
+    islink as _islink,
+    ismount as _ismount,
+    join as _join,
+    normpath as _normpath,
+    realpath as _realpath,
+    relpath as _relpath,
+    samefile as _samefile,
+)
 from urllib.parse import quote as _urlquote
 from typing import Iterator, List, Optional, Union
 
 
 _StrOrPath = Union[str, os.PathLike]
 
+# FlexPath is immutable, so the string analysis behind ``parts``/``name`` (and
+# everything derived from ``name``) is a pure function of the string value.
+_ANALYSIS_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _compute_parts(s: str) -> tuple[str, ...]:
+    """Split ``s`` into parts similar to PurePosixPath.parts."""
+    # ``s`` is normalized, so the only empty components come from leading or
+    # trailing separators and a strip + split (both C-level) is enough
+    if s == "":
+        return tuple()
+    if s == "/":
+        return ("/",)
+    if s.startswith("/"):
+        body = s.strip("/")
+        return ("/",) + tuple(body.split("/")) if body else ("/",)
+    return tuple(s.strip("/").split("/"))
+
+
+@functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def _compute_last_component(s: str) -> str:
+    """Return the final component of ``s`` (``"/"`` for the root)."""
+    if s == "/":
+        return "/"
+    s = s.rstrip("/")
+    if s == "":
+        return ""
+    idx = s.rfind("/")
+    return s[idx + 1 :] if idx >= 0 else s
+
+
+def _is_normalized(s: str) -> bool:
+    """Return True if ``_normpath(s)`` would return ``s`` unchanged.
+
+    Only cheap substring checks are used, so the answer may be a conservative
+    False (e.g. ``"../.."``); it is never a wrong True.
+    """
+    if "//" in s or "/./" in s or "/../" in s or s.startswith("./"):
+        return False
+    if s.endswith(("/", "/.", "/..")):
+        return s == "/"
+    return True
+
 
 class FlexPath(str):
     """A POSIX-compatible pathlib-like path that subclasses ``str``.
@@ -33,9 +96,14 @@ class FlexPath(str):
         redundant separators) using ``os.path.normpath``. This does not resolve
         symlinks. The empty string is preserved as-is.
         """
-        s = os.fspath(path)
-        norm = "" if s == "" else os.path.normpath(s)
-        return str.__new__(cls, norm)
+        if type(path) is cls:
+            # Already a normalized, immutable FlexPath: reuse it as-is
+            return path
+        s = _fspath(path)
+        if s == "" or (type(s) is str and _is_normalized(s)):
+            # Already normalized: skip the pure-Python normpath walk
+            return str.__new__(cls, s)
+        return str.__new__(cls, _normpath(s))
 
     def __repr__(self) -> str:
         """Return a debug-friendly representation."""
@@ -46,30 +114,12 @@ class FlexPath(str):
         return str(self)
 
     # --- helpers ----------------------------------------------------------
-    def _is_abs(self) -> bool:
-        return str(self).startswith("/")
-
     def _split_parts(self) -> tuple[str, ...]:
-        """Split into parts similar to PurePosixPath.parts."""
-        s = str(self)
-        if s == "":
-            return tuple()
-        if s == "/":
-            return ("/",)
-        comps = [c for c in s.split("/") if c != ""]
-        if s.startswith("/"):
-            return ("/",) + tuple(comps)
-        return tuple(comps)
+        """Split into parts similar to PurePosixPath.parts (memoized)."""
+        return _compute_parts(str(self))
 
     def _last_component(self) -> str:
-        s = str(self)
-        if s == "/":
-            return "/"
-        s = s.rstrip("/")
-        if s == "":
-            return ""
-        idx = s.rfind("/")
-        return s[idx + 1 :] if idx >= 0 else s
+        return _compute_last_component(str(self))
 
     def _wrap(self, value: _StrOrPath) -> "FlexPath":
         """Internal: wrap a string/PathLike as FlexPath."""
@@ -84,12 +134,12 @@ class FlexPath(str):
     @property
     def anchor(self) -> str:
         """The concatenation of the drive and root (on POSIX just ``/`` or ``""``)."""
-        return "/" if self._is_abs() else ""
+        return "/" if self[:1] == "/" else ""
 
     @property
     def root(self) -> str:
         """The root component (``/`` on absolute POSIX paths, else ``""``)."""
-        return "/" if self._is_abs() else ""
+        return "/" if self[:1] == "/" else ""
 
     @property
     def drive(self) -> str:
@@ -143,22 +193,25 @@ class FlexPath(str):
         s = s.rstrip("/")
         if s == "":
             return self._wrap(".")
-        d = os.path.dirname(s)
+        d = _dirname(s)
         return self._wrap(d if d != "" else ".")
 
     @property
     def parents(self) -> tuple["FlexPath", ...]:
         """Tuple of ancestors, nearest first. Differs from pathlib's view type."""
+        # Single right-to-left scan over separators instead of recomputing
+        # ``parent`` for every ancestor
         res: list[FlexPath] = []
-        p: FlexPath = self
+        s = str(self).rstrip("/")
         while True:
-            par = p.parent
-            if str(par) == str(p):  # reached root '/'
+            i = s.rfind("/")
+            if i < 0:  # relative path exhausted; '.' is not reported
                 break
-            if str(par) == ".":
+            if s[:i].strip("/") == "":  # only the root remains
+                res.append(self._wrap(s[: i + 1] if i else "/"))
                 break
-            res.append(par)
-            p = par
+            s = s[:i].rstrip("/")
+            res.append(self._wrap(s))
         return tuple(res)
 
     def with_name(self, name: str) -> "FlexPath":
@@ -203,16 +256,24 @@ class FlexPath(str):
         """Join one or more paths to this path using POSIX semantics."""
         if not others:
             return self
-        joined = os.path.join(str(self), *(os.fspath(o) for o in others))
+        joined = _join(str(self), *(_fspath(o) for o in others))
         return self._wrap(joined)
 
     def __truediv__(self, other: _StrOrPath) -> "FlexPath":  # self / other
         """Implement ``/`` operator for joining with another path fragment."""
+        if type(other) is str:
+            # Fast path for the common ``p / "child"``; same result as joinpath
+            if other.startswith("/"):
+                return self._wrap(other)
+            s = str(self)
+            if s == "" or (s == "." and other):
+                return self._wrap(other)
+            return self._wrap(s + other if s.endswith("/") else s + "/" + other)
         return self.joinpath(other)
 
     def __rtruediv__(self, other: _StrOrPath) -> "FlexPath":  # other / self
         """Allow joining when ``other`` is left operand (e.g., ``"/tmp" / p``)."""
-        return self._wrap(os.path.join(os.fspath(other), str(self)))
+        return self._wrap(_join(_fspath(other), str(self)))
 
     # --- conversions ------------------------------------------------------
     def as_posix(self) -> str:
@@ -229,7 +290,7 @@ class FlexPath(str):
 
         Raises ValueError if the path is not absolute.
         """
-        if not self.is_absolute():
+        if self[:1] != "/":
             raise ValueError("relative path can't be expressed as a file URI")
         # Percent-encode characters as per RFC 8089
         return "file://" + _urlquote(self.as_posix(), safe="/:")
@@ -242,48 +303,48 @@ class FlexPath(str):
     @classmethod
     def home(cls) -> "FlexPath":
         """Return the user's home directory as ``FlexPath`` (POSIX)."""
-        return cls(os.path.expanduser("~"))
+        return cls(_expanduser("~"))
 
     # --- normalization ----------------------------------------------------
     def expanduser(self) -> "FlexPath":
         """Expand a leading ``~`` or ``~user`` to the user's home directory."""
-        return self._wrap(os.path.expanduser(str(self)))
+        return self._wrap(_expanduser(str(self)))
 
     def resolve(self, strict: bool = False) -> "FlexPath":
         """Resolve symlinks and ``..``/``.`` elements. If ``strict`` and target
         doesn't exist, raise ``FileNotFoundError``.
         """
         s = str(self)
-        if strict and not os.path.exists(s):
+        if strict and not _exists(s):
             raise FileNotFoundError(s)
-        return self._wrap(os.path.realpath(s))
+        return self._wrap(_realpath(s))
 
     def absolute(self) -> "FlexPath":
         """Return an absolute path without resolving symlinks."""
-        return self._wrap(os.path.abspath(str(self)))
+        return self._wrap(_abspath(str(self)))
 
     def is_absolute(self) -> bool:
         """Whether the path is absolute (starts with ``/`` on POSIX)."""
-        return os.path.isabs(str(self))
+        return self[:1] == "/"
 
     def relative_to(self, *other: _StrOrPath) -> "FlexPath":
         """Return the relative path to ``other`` (raises ``ValueError`` if not
         a subpath). Accepts one or more path segments like pathlib.
         """
-        base = os.path.join(*(os.fspath(o) for o in other)) if other else ""
-        sp = os.path.normpath(str(self))
-        bp = os.path.normpath(base)
+        base = _join(*(_fspath(o) for o in other)) if other else ""
+        sp = _normpath(str(self))
+        bp = _normpath(base)
         # Both must be absolute or both relative for pathlib-like semantics
-        if os.path.isabs(sp) != os.path.isabs(bp):
+        if _isabs(sp) != _isabs(bp):
             raise ValueError(f"{self!s} and {bp!s} are on different anchors")
         try:
-            common = os.path.commonpath([sp, bp])
+            common = _commonpath([sp, bp])
         except ValueError:
             # Different drives (not possible on POSIX) or invalid
             raise ValueError(f"{self!s} is not in the subpath of {bp!s}")
         if common != bp:
             raise ValueError(f"{self!s} is not in the subpath of {bp!s}")
-        rel = os.path.relpath(sp, bp)
+        rel = _relpath(sp, bp)
         return self._wrap("." if rel == "." else rel)
 
     def is_relative_to(self, *other: _StrOrPath) -> bool:
@@ -297,55 +358,55 @@ class FlexPath(str):
     # --- filesystem checks ------------------------------------------------
     def exists(self) -> bool:
         """True if the path points to an existing filesystem entry."""
-        return os.path.exists(str(self))
+        return _exists(str(self))
 
     def is_file(self) -> bool:
         """True if the path points to a regular file."""
-        return os.path.isfile(str(self))
+        return _isfile(str(self))
 
     def is_dir(self) -> bool:
         """True if the path points to a directory."""
-        return os.path.isdir(str(self))
+        return _isdir(str(self))
 
     def is_symlink(self) -> bool:
         """True if the path is a symbolic link."""
-        return os.path.islink(str(self))
+        return _islink(str(self))
 
     def is_mount(self) -> bool:
         """True if the path is a mount point (POSIX heuristic via ``os.path.ismount``)."""
-        return os.path.ismount(str(self))
+        return _ismount(str(self))
 
-    def is_block_device(self) -> bool:
-        """True if the path is a block device (POSIX; requires existence)."""
+    def file_type(self) -> int:
+        """Return the file-type bits of ``st_mode`` from a single ``lstat()`` call.
+
+        Test the result with the ``stat.S_IS*`` helpers to classify an entry
+        without one syscall per check. Raises ``FileNotFoundError`` if the
+        path does not exist.
+        """
+        return _stat.S_IFMT(os.lstat(str(self)).st_mode)
+
+    def _lstat_type(self) -> int:
+        """Internal: like ``file_type()`` but ``0`` for a missing path."""
         try:
-            mode = os.lstat(str(self)).st_mode
+            return self.file_type()
         except FileNotFoundError:
-            return False
-        return _stat.S_ISBLK(mode)
+            return 0
+
+    def is_block_device(self) -> bool:
+        """True if the path is a block device (POSIX; requires existence)."""
+        return _stat.S_ISBLK(self._lstat_type())
 
     def is_char_device(self) -> bool:
         """True if the path is a character device (POSIX; requires existence)."""
-        try:
-            mode = os.lstat(str(self)).st_mode
-        except FileNotFoundError:
-            return False
-        return _stat.S_ISCHR(mode)
+        return _stat.S_ISCHR(self._lstat_type())
 
     def is_fifo(self) -> bool:
         """True if the path is a FIFO (named pipe)."""
-        try:
-            mode = os.lstat(str(self)).st_mode
-        except FileNotFoundError:
-            return False
-        return _stat.S_ISFIFO(mode)
+        return _stat.S_ISFIFO(self._lstat_type())
 
     def is_socket(self) -> bool:
         """True if the path is a UNIX domain socket."""
-        try:
-            mode = os.lstat(str(self)).st_mode
-        except FileNotFoundError:
-            return False
-        return _stat.S_ISSOCK(mode)
+        return _stat.S_ISSOCK(self._lstat_type())
 
     # --- filesystem ops ---------------------------------------------------
     def mkdir(self, mode: int = 0o777, parents: bool = True, exist_ok: bool = True) -> None:
@@ -388,17 +449,17 @@ class FlexPath(str):
 
     def rename(self, target: _StrOrPath) -> "FlexPath":
         """Rename this path to ``target``. Returns the new path."""
-        os.rename(str(self), os.fspath(target))
-        return self._wrap(os.fspath(target))
+        os.rename(str(self), _fspath(target))
+        return self._wrap(_fspath(target))
 
     def replace(self, target: _StrOrPath) -> "FlexPath":
         """Rename, overwriting ``target`` if it exists. Returns the new path."""
-        os.replace(str(self), os.fspath(target))
-        return self._wrap(os.fspath(target))
+        os.replace(str(self), _fspath(target))
+        return self._wrap(_fspath(target))
 
     def samefile(self, other: _StrOrPath) -> bool:
         """Return True if this path and ``other`` refer to the same file."""
-        return os.path.samefile(str(self), os.fspath(other))
+        return _samefile(str(self), _fspath(other))
 
     def readlink(self) -> "FlexPath":
         """Return the path to which the symbolic link points (not resolved)."""
@@ -409,11 +470,11 @@ class FlexPath(str):
 
         ``target_is_directory`` is ignored on POSIX (optional for API parity).
         """
-        os.symlink(os.fspath(target), str(self))
+        os.symlink(_fspath(target), str(self))
 
     def link_to(self, target: _StrOrPath) -> None:
         """Create a hard link pointing to ``target`` named at this path."""
-        os.link(os.fspath(target), str(self))
+        os.link(_fspath(target), str(self))
 
     def chmod(self, mode: int, *, follow_symlinks: bool = True) -> None:
         """Change permissions to ``mode``. On POSIX, ``follow_symlinks`` is honored."""
@@ -439,25 +500,36 @@ class FlexPath(str):
         os.close(fd)
 
     def iterdir(self) -> Iterator["FlexPath"]:
-        """Iterate over directory entries (names are not sorted)."""
-        if not self.is_dir():
-            raise NotADirectoryError(f"Not a directory: {self}")
-        for name in os.listdir(str(self)):
-            yield self._wrap(os.path.join(str(self), name))
-
-    def glob(self, pattern: str) -> Iterator["FlexPath"]:
-        """Yield paths matching a glob pattern relative to this directory."""
+        """Iterate over directory entries (names are not sorted).
+
+        Raises ``NotADirectoryError`` or ``FileNotFoundError`` from the OS when
+        the path is not an existing directory.
+        """
+        with os.scandir(str(self)) as it:
+            for entry in it:
+                yield self._wrap(entry.path)
+
+    def glob(self, pattern: str, sort: bool = False) -> Iterator["FlexPath"]:
+        """Yield paths matching a glob pattern relative to this directory.
+
+        Results are streamed in directory order; pass ``sort=True`` to collect
+        and yield them sorted.
+        """
         base = str(self)
         recursive = "**" in pattern
-        paths = sorted(_glob.iglob(os.path.join(base, pattern), recursive=recursive))
+        paths = _glob.iglob(_join(base, pattern), recursive=recursive)
+        if sort:
+            paths = sorted(paths)
         for p in paths:
             yield self._wrap(p)
 
-    def rglob(self, pattern: str) -> Iterator["FlexPath"]:
-        """Recursive glob (``**`` is implied)."""
+    def rglob(self, pattern: str, sort: bool = False) -> Iterator["FlexPath"]:
+        """Recursive glob (``**`` is implied). See ``glob`` for ``sort``."""
         base = str(self)
         pat = pattern if pattern.startswith("**/") else f"**/{pattern}"
-        paths = sorted(_glob.iglob(os.path.join(base, pat), recursive=True))
+        paths = _glob.iglob(_join(base, pat), recursive=True)
+        if sort:
+            paths = sorted(paths)
         for p in paths:
             yield self._wrap(p)
 
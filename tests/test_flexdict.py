@@ -10,6 +10,8 @@ This module tests all functionality of the FlexDict class including:
 """
 
 import copy
+import pickle
+import weakref
 import pytest
 from flexlib.flexdict import FlexDict
 
@@ -47,6 +49,49 @@ class TestFlexDictInstantiation:
         assert fd.abilities.english == "strong"
         assert isinstance(fd.abilities, FlexDict)
 
+    def test_from_flat_instantiation(self):
+        """Test creating FlexDict from flat dotted keys."""
+        fd = FlexDict.from_flat({"db.host": "localhost", "db.port": 5432, "debug": True})
+        assert fd.db.host == "localhost"
+        assert fd.db.port == 5432
+        assert fd.debug is True
+        assert isinstance(fd.db, FlexDict)
+        
+        fd = FlexDict.from_flat({"a/b/c": 1}, sep="/")
+        assert fd.a.b.c == 1
+
+    def test_from_flat_merges_without_mutating_input(self):
+        """Test that from_flat merges into dict values without mutating them."""
+        user = {"name": "John"}
+        fd = FlexDict.from_flat({"user": user, "user.age": 40})
+        assert fd.user.to_dict() == {"name": "John", "age": 40}
+        assert user == {"name": "John"}
+        
+        with pytest.raises(ValueError):
+            FlexDict.from_flat({"a": 1, "a.b": 2})
+
+    @pytest.mark.parametrize("mapping", [
+        {"a": 2, "a.b": 1},
+        {"a.b": 1, "a": 2},
+        {"a": {"b": 1}, "a.b.c": 2},
+        {"a.b.c": 2, "a": {"b": 1}},
+    ])
+    def test_from_flat_conflict_in_either_order(self, mapping):
+        """Test that from_flat rejects a conflict whatever the key order."""
+        with pytest.raises(ValueError):
+            FlexDict.from_flat(mapping)
+
+    @pytest.mark.parametrize("mapping", [
+        {"a.b": 1, "a": {"c": 2}},
+        {"a": {"c": 2}, "a.b": 1},
+    ])
+    def test_from_flat_merge_in_either_order(self, mapping):
+        """Test that from_flat merges dict values whatever the key order."""
+        source = mapping["a"]
+        fd = FlexDict.from_flat(mapping)
+        assert fd.to_dict() == {"a": {"b": 1, "c": 2}}
+        assert source == {"c": 2}
+
 
 class TestDotNotationAccess:
     """Test dot notation access functionality."""
@@ -157,6 +202,20 @@ class TestDictionaryCompatibility:
             keys.append(key)
         assert set(keys) == {"a", "b", "c"}
 
+    def test_iteration_uses_dict_implementations(self):
+        """Test that iteration and views are inherited from dict, not overridden."""
+        for name in ("__iter__", "keys", "values", "items"):
+            assert getattr(FlexDict, name) is getattr(dict, name)
+
+    def test_weak_reference(self):
+        """Test that FlexDicts (frozen or not) support weak references."""
+        fd = FlexDict(a=1)
+        ref = weakref.ref(fd)
+        assert ref() is fd
+        fd.freeze()
+        assert ref() is fd
+        assert weakref.ref(fd)() is fd
+
 
 class TestNestedStructures:
     """Test handling of nested structures."""
@@ -179,6 +238,38 @@ class TestNestedStructures:
         assert fd.user.name == "John"
         assert fd.user.profile.age == 30
 
+    def test_deep_dict_conversion(self):
+        """Test converting nesting deeper than the recursion limit."""
+        nested = {"value": 1}
+        for _ in range(5000):
+            nested = {"child": nested}
+        
+        fd = FlexDict(nested)
+        node = fd
+        for _ in range(5000):
+            node = node["child"]
+            assert type(node) is FlexDict
+        assert node.value == 1
+
+    def test_self_referencing_dict_conversion(self):
+        """Test that cyclic plain dicts convert into cyclic FlexDicts."""
+        data = {"name": "root"}
+        data["self"] = data
+        
+        fd = FlexDict(data)
+        assert isinstance(fd.self, FlexDict)
+        assert fd.self.self is fd.self
+        assert fd.self.name == "root"
+
+    def test_shared_dict_conversion_is_independent(self):
+        """Test that a dict appearing twice converts into independent FlexDicts."""
+        shared = {"x": 1}
+        fd = FlexDict({"a": shared, "b": shared})
+        fd.a.y = 2
+        assert fd.a is not fd.b
+        assert fd.b == {"x": 1}
+        assert shared == {"x": 1}
+
     def test_assignment_of_nested_dicts(self):
         """Test assigning nested dictionaries."""
         fd = FlexDict()
@@ -189,6 +280,18 @@ class TestNestedStructures:
         assert fd.config.database.host == "localhost"
         assert fd.config.database.port == 5432
 
+    def test_assignment_of_flexdict_is_by_reference(self):
+        """Test that assigning an existing FlexDict stores it without copying."""
+        child = FlexDict(a=1)
+        fd = FlexDict()
+        fd["x"] = child
+        fd.y = child
+        fd.update(z=child)
+        
+        assert fd.x is child
+        assert fd.y is child
+        assert fd.z is child
+
     def test_deep_nesting(self):
         """Test very deep nesting scenarios."""
         fd = FlexDict()
@@ -229,6 +332,31 @@ class TestUpdateMethod:
         assert fd.b == 2
         assert fd.c == 3
 
+    def test_update_with_items_only_object(self):
+        """Test update with an object that has items() but no keys()."""
+        class ItemsOnly:
+            def items(self):
+                return [("name", "John"), ("address", {"city": "NYC"})]
+        
+        fd = FlexDict()
+        fd.update(ItemsOnly())
+        assert fd.name == "John"
+        assert isinstance(fd.address, FlexDict)
+        assert fd.address.city == "NYC"
+
+    def test_update_converts_nested_dicts(self):
+        """Test that update wraps nested dicts from every argument form."""
+        fd = FlexDict()
+        fd.update({"a": {"x": 1}}, b={"y": 2})
+        fd.update([("c", {"z": 3})])
+        
+        assert isinstance(fd.a, FlexDict)
+        assert isinstance(fd.b, FlexDict)
+        assert isinstance(fd.c, FlexDict)
+        assert fd.a.x == 1
+        assert fd.b.y == 2
+        assert fd.c.z == 3
+
 
 class TestUtilityMethods:
     """Test utility methods."""
@@ -252,6 +380,48 @@ class TestUtilityMethods:
         assert isinstance(regular_dict["user"], dict)
         assert not isinstance(regular_dict["user"], FlexDict)
 
+    def test_to_dict_deep_nesting(self):
+        """Test to_dict on nesting deeper than the recursion limit."""
+        fd = FlexDict()
+        node = fd
+        for _ in range(5000):
+            node = node.child
+        node.value = 1
+        
+        result = fd.to_dict()
+        depth = 0
+        while "child" in result:
+            assert type(result) is dict
+            result = result["child"]
+            depth += 1
+        assert depth == 5000
+        assert result == {"value": 1}
+
+    def test_to_dict_self_reference(self):
+        """Test to_dict maps a self-referencing FlexDict to a cyclic dict."""
+        fd = FlexDict(name="root")
+        fd.me = fd
+        fd.child.parent = fd
+        
+        result = fd.to_dict()
+        assert type(result) is dict
+        assert result["me"] is result
+        assert type(result["child"]) is dict
+        assert result["child"]["parent"] is result
+        assert result["name"] == "root"
+
+    def test_to_dict_shared_child_is_independent(self):
+        """Test to_dict copies a FlexDict stored under two keys independently."""
+        fd = FlexDict()
+        child = FlexDict(x=1)
+        fd.a = child
+        fd.b = child
+        
+        result = fd.to_dict()
+        assert result["a"] is not result["b"]
+        result["a"]["y"] = 2
+        assert result["b"] == {"x": 1}
+
     def test_repr_method(self):
         """Test string representation."""
         fd = FlexDict()
@@ -263,6 +433,9 @@ class TestUtilityMethods:
         assert "FlexDict" in repr_str
         assert "name" in repr_str
         assert "John" in repr_str
+        
+        fd.child.value = 1
+        assert repr(fd) == "FlexDict({'name': 'John', 'age': 30, 'child': FlexDict({'value': 1})})"
 
     def test_deepcopy(self):
         """Test deep copying functionality."""
@@ -282,6 +455,136 @@ class TestUtilityMethods:
         assert isinstance(fd_copy, FlexDict)
         assert isinstance(fd_copy.user, FlexDict)
 
+    def test_deepcopy_shared_references(self):
+        """Test that shared and cyclic references are preserved by deepcopy."""
+        fd = FlexDict()
+        shared = [1, 2]
+        fd.a.items_list = shared
+        fd.b.items_list = shared
+        fd.a.back = fd
+        
+        fd_copy = copy.deepcopy(fd)
+        assert fd_copy.a.items_list is fd_copy.b.items_list
+        assert fd_copy.a.items_list is not shared
+        assert fd_copy.a.back is fd_copy
+
+    def test_deepcopy_deep_nesting(self):
+        """Test deepcopy on nesting deeper than the recursion limit."""
+        fd = FlexDict()
+        node = fd
+        for _ in range(5000):
+            node = node.child
+        node.scores = [1, 2]
+        
+        fd_copy = copy.deepcopy(fd)
+        node_copy = fd_copy
+        for _ in range(5000):
+            node_copy = node_copy.child
+        assert node_copy.scores == [1, 2]
+        assert node_copy.scores is not node.scores
+
+    def test_deepcopy_preserves_frozen(self):
+        """Test that deepcopy of a frozen FlexDict stays frozen."""
+        fd = FlexDict({"a": {"b": 1}}).freeze()
+        fd_copy = copy.deepcopy(fd)
+        assert fd_copy == {"a": {"b": 1}}
+        with pytest.raises(AttributeError):
+            _ = fd_copy.a.missing
+
+    def test_pickle_round_trip(self):
+        """Test pickling preserves nesting, cycles, and frozen state."""
+        fd = FlexDict({"user": {"name": "John", "scores": [1, 2]}})
+        fd.user.root = fd
+        
+        loaded = pickle.loads(pickle.dumps(fd))
+        assert type(loaded) is FlexDict
+        assert isinstance(loaded.user, FlexDict)
+        assert loaded.user.scores == [1, 2]
+        assert loaded.user.root is loaded
+        
+        frozen = pickle.loads(pickle.dumps(FlexDict(a={"b": 1}).freeze()))
+        assert frozen.a.b == 1
+        with pytest.raises(AttributeError):
+            _ = frozen.a.missing
+
+    def test_shallow_copy(self):
+        """Test copy.copy shares nested values."""
+        fd = FlexDict({"user": {"name": "John"}})
+        fd_copy = copy.copy(fd)
+        assert type(fd_copy) is FlexDict
+        assert fd_copy == fd
+        assert fd_copy.user is fd.user
+
+
+class TestFreeze:
+    """Test freezing attribute access."""
+
+    def test_freeze_reads_existing_values(self):
+        """Test that frozen FlexDicts still read values via dot notation."""
+        fd = FlexDict({"solver": {"tol": 1e-6, "steps": 10}}).freeze()
+        assert fd.solver.tol == 1e-6
+        assert fd.solver.steps == 10
+        assert isinstance(fd, FlexDict)
+        assert isinstance(fd.solver, FlexDict)
+
+    def test_freeze_missing_attribute_raises(self):
+        """Test that frozen FlexDicts don't auto-create missing keys."""
+        fd = FlexDict({"solver": {"tol": 1e-6}})
+        assert fd.freeze() is fd
+        
+        with pytest.raises(AttributeError):
+            _ = fd.missing
+        with pytest.raises(AttributeError):
+            _ = fd.solver.missing
+        assert "missing" not in fd
+        assert "missing" not in fd.solver
+        assert fd.to_dict() == {"solver": {"tol": 1e-6}}
+
+    def test_freeze_covers_children_added_later(self):
+        """Test that dicts assigned after freezing are frozen as well."""
+        fd = FlexDict().freeze()
+        fd.attr = {"a": 1}
+        fd["item"] = {"b": 2}
+        fd.update(updated={"c": 3})
+        fd.flex = FlexDict({"d": {"e": 4}})
+        
+        for key in ("attr", "item", "updated", "flex"):
+            with pytest.raises(AttributeError):
+                _ = fd[key].typo
+            assert "typo" not in fd[key]
+        with pytest.raises(AttributeError):
+            _ = fd.flex.d.typo
+        assert fd.attr.a == 1
+
+    def test_freeze_rejects_subclass_without_mutating(self):
+        """Test that a FlexDict subclass anywhere in the tree fails before freezing."""
+        class MyFlexDict(FlexDict):
+            pass
+        
+        root = FlexDict(a={"b": 1})
+        root["c"] = MyFlexDict(x=1)
+        with pytest.raises(TypeError):
+            root.freeze()
+        assert type(root) is FlexDict
+        assert type(root.a) is FlexDict
+        assert type(root.c) is MyFlexDict
+        
+        frozen = FlexDict().freeze()
+        with pytest.raises(TypeError):
+            frozen.child = MyFlexDict()
+        assert "child" not in frozen
+        with pytest.raises(TypeError):
+            frozen.update(child=MyFlexDict())
+        assert "child" not in frozen
+
+    def test_freeze_self_reference(self):
+        """Test freezing a FlexDict that contains itself."""
+        fd = FlexDict(a=1)
+        fd.me = fd
+        assert fd.freeze().me is fd
+        with pytest.raises(AttributeError):
+            _ = fd.me.missing
+
 
 class TestErrorHandling:
     """Test error handling and edge cases."""
@@ -297,6 +600,11 @@ class TestErrorHandling:
         # But setting dict method names as attributes should raise error
         with pytest.raises(AttributeError):
             fd.keys = "something"  # Should raise AttributeError
+        
+        # FlexDict's own methods are protected the same way
+        with pytest.raises(AttributeError):
+            fd.to_dict = "something"
+        assert "to_dict" not in fd
 
     def test_attribute_error_for_private_attributes(self):
         """Test that private attributes raise AttributeError."""
@@ -315,6 +623,18 @@ class TestErrorHandling:
         with pytest.raises(AttributeError):
             del fd.nonexistent
 
+    def test_bracket_access_does_not_auto_create(self):
+        """Test that only dot notation auto-creates missing keys."""
+        fd = FlexDict()
+        
+        with pytest.raises(KeyError):
+            _ = fd["missing"]
+        assert fd.get("missing") is None
+        assert "missing" not in fd
+        
+        fd.none_value = None
+        assert fd.none_value is None
+
     def test_complex_key_types(self):
         """Test handling of complex key types."""
         fd = FlexDict()
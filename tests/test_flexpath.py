@@ -1,413 +1,443 @@
 #!/usr/bin/env python3
-"""Comprehensive test suite for FlexPath class."""
+"""Comprehensive test suite for FlexPath class.
+
+The filesystem tests give every test its own uuid-named subdirectory of
+the class temp root, so they are safe to run in parallel with
+``pytest -n auto`` (pytest-xdist) without colliding.
+"""
 
-import unittest
 import tempfile
 import os
-import shutil
 import stat
 import platform
 from pathlib import Path
 import sys
+import uuid
+
+import pytest
 
 from flexlib.flexpath import FlexPath
 
 
-class TestFlexPathPlatform(unittest.TestCase):
+_SYSTEM = platform.system()
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
+# Put filesystem test roots on tmpfs when available to avoid disk sync latency
+_SHM_DIR = "/dev/shm" if _IS_LINUX and os.access("/dev/shm", os.W_OK) else None
+
+
+def _assert_is_dir(path):
+    """Assert ``path`` is an existing directory using a single stat()."""
+    assert stat.S_ISDIR(os.stat(path).st_mode)
+
+
+def _assert_is_reg(path):
+    """Assert ``path`` is an existing regular file using a single stat()."""
+    assert stat.S_ISREG(os.stat(path).st_mode)
+
+
+# Shared read-only paths for tests that don't exercise construction itself
+_P_HOME_USER = FlexPath("/home/user")
+_P_FILE_TXT = FlexPath("/home/user/file.txt")
+_P_DOCS = FlexPath("/home/user/docs")
+_P_ARCHIVE = FlexPath("/home/user/archive.tar.gz")
+_P_ROOT = FlexPath("/")
+_MATCH_PATH = FlexPath("/home/user/file.txt")
+_MATCH_PATH_UPPER = FlexPath("/home/user/File.TXT")
+
+# Home and working directory, resolved once for the whole module
+_HOME_STR = os.path.expanduser("~")
+_CWD_STR = os.getcwd()
+_HOME_FP = FlexPath(_HOME_STR)
+
+# Expected FlexPath("/home/user/docs/file.txt").parents, as plain strings
+_EXPECTED_PARENTS = ("/home/user/docs", "/home/user", "/home", "/")
+
+
+def _mkfiles(dir_str, names):
+    """Create empty files in ``dir_str`` with one open/close each (setup helper)."""
+    for name in names:
+        os.close(os.open(os.path.join(dir_str, name), os.O_WRONLY | os.O_CREAT, 0o600))
+
+
+def _fast_rmtree(root):
+    """Remove the shallow test tree at ``root`` with plain scandir/unlink/rmdir."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(root)
+
+
+def _write(path, data):
+    """Write ``data`` bytes to ``path`` through a raw file descriptor (setup helper)."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+class TestFlexPathPlatform:
     """Test platform-specific behaviors."""
 
     def test_platform_compatibility(self):
         """Test that FlexPath works on supported platforms."""
-        current_platform = platform.system()
+        current_platform = _SYSTEM
         supported_platforms = ["Linux", "Darwin"]  # Darwin is macOS
         
         if current_platform in supported_platforms:
             # Basic functionality should work
             p = FlexPath("/tmp/test")
-            self.assertTrue(p.is_absolute())
-            self.assertEqual(str(p), "/tmp/test")
+            assert p.is_absolute()
+            assert str(p) == "/tmp/test"
         else:
             # Should still work on other POSIX systems
             p = FlexPath("/tmp/test")
-            self.assertEqual(str(p), "/tmp/test")
+            assert str(p) == "/tmp/test"
 
-    @unittest.skipUnless(platform.system() == "Darwin", "macOS-specific test")
+    @pytest.mark.skipif(not _IS_DARWIN, reason="macOS-specific test")
     def test_macos_paths(self):
         """Test macOS-specific path behaviors."""
         # Test typical macOS paths
         home = FlexPath("~/Library/Preferences")
         expanded = home.expanduser()
-        self.assertTrue(str(expanded).endswith("/Library/Preferences"))
+        assert str(expanded).endswith("/Library/Preferences")
         
         # Test Applications folder
         apps = FlexPath("/Applications")
-        self.assertEqual(str(apps), "/Applications")
+        assert str(apps) == "/Applications"
         
         # Test Volumes (mount points on macOS)
         volumes = FlexPath("/Volumes")
-        self.assertEqual(str(volumes), "/Volumes")
+        assert str(volumes) == "/Volumes"
 
-    @unittest.skipUnless(platform.system() == "Darwin", "macOS-specific test")
+    @pytest.mark.skipif(not _IS_DARWIN, reason="macOS-specific test")
     def test_macos_home_directory(self):
         """Test macOS home directory patterns."""
-        home = FlexPath.home()
-        self.assertTrue(str(home).startswith("/Users/") or str(home).startswith("/var/"))
+        home = _HOME_FP
+        assert str(home).startswith("/Users/") or str(home).startswith("/var/")
         
         # Test typical macOS user subdirectories
         desktop = home / "Desktop"
         documents = home / "Documents"
         downloads = home / "Downloads"
         
-        self.assertTrue(str(desktop).endswith("/Desktop"))
-        self.assertTrue(str(documents).endswith("/Documents"))
-        self.assertTrue(str(downloads).endswith("/Downloads"))
+        assert str(desktop).endswith("/Desktop")
+        assert str(documents).endswith("/Documents")
+        assert str(downloads).endswith("/Downloads")
 
-    @unittest.skipUnless(platform.system() == "Linux", "Linux-specific test")
+    @pytest.mark.skipif(not _IS_LINUX, reason="Linux-specific test")
     def test_linux_paths(self):
         """Test Linux-specific path behaviors."""
         # Test typical Linux paths
-        home = FlexPath.home()
-        self.assertTrue(str(home).startswith("/home/") or str(home).startswith("/root"))
+        home = _HOME_FP
+        assert str(home).startswith("/home/") or str(home).startswith("/root")
         
         # Test proc filesystem
         proc = FlexPath("/proc")
-        self.assertEqual(str(proc), "/proc")
+        assert str(proc) == "/proc"
         
         # Test sys filesystem
         sys_path = FlexPath("/sys")
-        self.assertEqual(str(sys_path), "/sys")
+        assert str(sys_path) == "/sys"
 
     def test_cross_platform_temp_directory(self):
         """Test temporary directory handling across platforms."""
         # This should work on both Linux and macOS
         temp_dir = FlexPath(tempfile.gettempdir())
-        self.assertTrue(temp_dir.exists())
-        self.assertTrue(temp_dir.is_dir())
+        _assert_is_dir(temp_dir)
         
-        if platform.system() == "Darwin":
+        if _IS_DARWIN:
             # macOS typically uses /var/folders/... for temp
-            self.assertTrue(str(temp_dir).startswith("/var/") or str(temp_dir).startswith("/tmp"))
-        elif platform.system() == "Linux":
+            assert str(temp_dir).startswith("/var/") or str(temp_dir).startswith("/tmp")
+        elif _IS_LINUX:
             # Linux typically uses /tmp
-            self.assertTrue(str(temp_dir).startswith("/tmp") or str(temp_dir).startswith("/var/tmp"))
+            assert str(temp_dir).startswith("/tmp") or str(temp_dir).startswith("/var/tmp")
 
 
-class TestFlexPathConstruction(unittest.TestCase):
+class TestFlexPathConstruction:
     """Test FlexPath construction and basic operations."""
 
-    def test_construction_from_string(self):
-        """Test creating FlexPath from string."""
+    @pytest.mark.parametrize("arg,expected", [
+        ("/home/user", "/home/user"),
+        # os.PathLike argument
+        (Path("/tmp/test"), "/tmp/test"),
+        ("", ""),
+        # Normalization during construction
+        ("/home//user/./docs/../files", "/home/user/files"),
+        # Trailing separators and dot segments
+        ("/home/user/", "/home/user"),
+        ("/home/user/.", "/home/user"),
+        ("/home/user/..", "/home"),
+        ("../docs", "../docs"),
+        ("/", "/"),
+    ])
+    def test_construction(self, arg, expected):
+        """Test creating FlexPath from strings and path-like objects."""
+        assert str(FlexPath(arg)) == expected
+
+    def test_construction_from_flexpath(self):
+        """Test that wrapping a FlexPath returns the same instance."""
         p = FlexPath("/home/user")
-        self.assertEqual(str(p), "/home/user")
-        self.assertIsInstance(p, str)
-        self.assertIsInstance(p, FlexPath)
-
-    def test_construction_from_pathlike(self):
-        """Test creating FlexPath from os.PathLike object."""
-        path_obj = Path("/tmp/test")
-        p = FlexPath(path_obj)
-        self.assertEqual(str(p), "/tmp/test")
-
-    def test_construction_empty(self):
-        """Test creating FlexPath with empty string."""
-        p = FlexPath("")
-        self.assertEqual(str(p), "")
-
-    def test_construction_normalization(self):
-        """Test path normalization during construction."""
-        p = FlexPath("/home//user/./docs/../files")
-        self.assertEqual(str(p), "/home/user/files")
-
-    def test_repr(self):
-        """Test string representation."""
-        p = FlexPath("/home/user")
-        self.assertEqual(repr(p), "FlexPath('/home/user')")
+        assert FlexPath(p) is p
 
-    def test_fspath(self):
-        """Test PEP 519 filesystem path representation."""
+    def test_str_representations(self):
+        """Test type, repr and PEP 519 filesystem path representation."""
         p = FlexPath("/home/user")
-        self.assertEqual(os.fspath(p), "/home/user")
+        assert isinstance(p, str)
+        assert isinstance(p, FlexPath)
+        assert repr(p) == "FlexPath('/home/user')"
+        assert os.fspath(p) == "/home/user"
 
 
-class TestFlexPathProperties(unittest.TestCase):
+class TestFlexPathProperties:
     """Test FlexPath properties and path components."""
 
-    def test_parts_absolute(self):
-        """Test parts property for absolute paths."""
-        p = FlexPath("/home/user/docs")
-        self.assertEqual(p.parts, ("/", "home", "user", "docs"))
-
-    def test_parts_relative(self):
-        """Test parts property for relative paths."""
-        p = FlexPath("user/docs")
-        self.assertEqual(p.parts, ("user", "docs"))
-
-    def test_parts_root(self):
-        """Test parts property for root path."""
-        p = FlexPath("/")
-        self.assertEqual(p.parts, ("/",))
-
-    def test_parts_empty(self):
-        """Test parts property for empty path."""
-        p = FlexPath("")
-        self.assertEqual(p.parts, ())
-
-    def test_anchor(self):
-        """Test anchor property."""
-        abs_path = FlexPath("/home/user")
-        rel_path = FlexPath("home/user")
-        self.assertEqual(abs_path.anchor, "/")
-        self.assertEqual(rel_path.anchor, "")
-
-    def test_root(self):
-        """Test root property."""
-        abs_path = FlexPath("/home/user")
-        rel_path = FlexPath("home/user")
-        self.assertEqual(abs_path.root, "/")
-        self.assertEqual(rel_path.root, "")
-
-    def test_drive(self):
-        """Test drive property (always empty on POSIX)."""
-        p = FlexPath("/home/user")
-        self.assertEqual(p.drive, "")
-
-    def test_name(self):
-        """Test name property."""
-        p = FlexPath("/home/user/file.txt")
-        self.assertEqual(p.name, "file.txt")
-        
-        root = FlexPath("/")
-        self.assertEqual(root.name, "/")
-
-    def test_suffix(self):
-        """Test suffix property."""
-        p = FlexPath("/home/user/file.txt")
-        self.assertEqual(p.suffix, ".txt")
-        
-        no_suffix = FlexPath("/home/user/file")
-        self.assertEqual(no_suffix.suffix, "")
-
-    def test_suffixes(self):
-        """Test suffixes property."""
-        p = FlexPath("/home/user/archive.tar.gz")
-        self.assertEqual(p.suffixes, [".tar", ".gz"])
-        
-        single_suffix = FlexPath("/home/user/file.txt")
-        self.assertEqual(single_suffix.suffixes, [".txt"])
-        
-        no_suffix = FlexPath("/home/user/file")
-        self.assertEqual(no_suffix.suffixes, [])
-
-    def test_stem(self):
-        """Test stem property."""
-        p = FlexPath("/home/user/file.txt")
-        self.assertEqual(p.stem, "file")
-        
-        multi_suffix = FlexPath("/home/user/archive.tar.gz")
-        self.assertEqual(multi_suffix.stem, "archive.tar")
-
-    def test_parent(self):
-        """Test parent property."""
-        p = FlexPath("/home/user/file.txt")
-        self.assertEqual(str(p.parent), "/home/user")
-        
-        root = FlexPath("/")
-        self.assertEqual(str(root.parent), "/")
-        
-        rel = FlexPath("user/file.txt")
-        self.assertEqual(str(rel.parent), "user")
+    @pytest.mark.parametrize("path,attr,expected", [
+        (_P_DOCS, "parts", ("/", "home", "user", "docs")),
+        ("user/docs", "parts", ("user", "docs")),
+        (_P_ROOT, "parts", ("/",)),
+        ("", "parts", ()),
+        (_P_HOME_USER, "anchor", "/"),
+        ("home/user", "anchor", ""),
+        (_P_HOME_USER, "root", "/"),
+        ("home/user", "root", ""),
+        (_P_HOME_USER, "drive", ""),
+        (_P_FILE_TXT, "name", "file.txt"),
+        (_P_ROOT, "name", "/"),
+        (_P_FILE_TXT, "suffix", ".txt"),
+        ("/home/user/file", "suffix", ""),
+        (_P_ARCHIVE, "suffixes", [".tar", ".gz"]),
+        (_P_FILE_TXT, "suffixes", [".txt"]),
+        ("/home/user/file", "suffixes", []),
+        (_P_FILE_TXT, "stem", "file"),
+        (_P_ARCHIVE, "stem", "archive.tar"),
+        (_P_FILE_TXT, "parent", "/home/user"),
+        (_P_ROOT, "parent", "/"),
+        ("user/file.txt", "parent", "user"),
+    ])
+    def test_property(self, path, attr, expected):
+        """Test path component properties."""
+        assert getattr(FlexPath(path), attr) == expected
 
     def test_parents(self):
         """Test parents property."""
         p = FlexPath("/home/user/docs/file.txt")
-        parents = p.parents
         # FlexPath implementation includes the root "/" in parents (matches pathlib behavior)
-        expected = [FlexPath("/home/user/docs"), FlexPath("/home/user"), FlexPath("/home"), FlexPath("/")]
-        self.assertEqual(list(parents), expected)
-
-
-class TestFlexPathManipulation(unittest.TestCase):
+        assert [str(x) for x in p.parents] == list(_EXPECTED_PARENTS)
+
+    @pytest.mark.parametrize("path,expected", [
+        ("a/b/c", ["a/b", "a"]),
+        ("a", []),
+        ("../a/b", ["../a", ".."]),
+        ("//a/b", ["//a", "//"]),
+        ("/a", ["/"]),
+        ("/", []),
+        ("", []),
+        (".", []),
+    ])
+    def test_parents_edge_cases(self, path, expected):
+        """Test parents of relative, double-slash, root and empty paths."""
+        assert [str(x) for x in FlexPath(path).parents] == expected
+
+
+class TestFlexPathManipulation:
     """Test path manipulation methods."""
 
-    def test_with_name(self):
-        """Test with_name method."""
-        p = FlexPath("/home/user/file.txt")
-        new_p = p.with_name("newfile.txt")
-        self.assertEqual(str(new_p), "/home/user/newfile.txt")
-
-    def test_with_name_invalid(self):
-        """Test with_name with invalid inputs."""
-        p = FlexPath("/home/user/file.txt")
-        with self.assertRaises(ValueError):
-            p.with_name("invalid/name")
-        with self.assertRaises(ValueError):
-            p.with_name("")
-
-    def test_with_suffix(self):
-        """Test with_suffix method."""
-        p = FlexPath("/home/user/file.txt")
-        new_p = p.with_suffix(".py")
-        self.assertEqual(str(new_p), "/home/user/file.py")
-        
-        # Remove suffix
-        no_suffix = p.with_suffix("")
-        self.assertEqual(str(no_suffix), "/home/user/file")
-
-    def test_with_suffix_invalid(self):
-        """Test with_suffix with invalid inputs."""
-        p = FlexPath("/home/user/file.txt")
-        with self.assertRaises(ValueError):
-            p.with_suffix("invalid")
-
-    def test_with_stem(self):
-        """Test with_stem method."""
-        p = FlexPath("/home/user/file.txt")
-        new_p = p.with_stem("newfile")
-        self.assertEqual(str(new_p), "/home/user/newfile.txt")
-
-    def test_with_stem_invalid(self):
-        """Test with_stem with invalid inputs."""
-        p = FlexPath("/home/user/file.txt")
-        with self.assertRaises(ValueError):
-            p.with_stem("invalid/stem")
-        with self.assertRaises(ValueError):
-            p.with_stem("")
-
-
-class TestFlexPathJoining(unittest.TestCase):
+    @pytest.mark.parametrize("method,arg,expected", [
+        ("with_name", "newfile.txt", "/home/user/newfile.txt"),
+        ("with_suffix", ".py", "/home/user/file.py"),
+        ("with_suffix", "", "/home/user/file"),
+        ("with_stem", "newfile", "/home/user/newfile.txt"),
+    ])
+    def test_with_component(self, method, arg, expected):
+        """Test with_name/with_suffix/with_stem methods."""
+        p = _P_FILE_TXT
+        assert str(getattr(p, method)(arg)) == expected
+
+    @pytest.mark.parametrize("method,arg", [
+        ("with_name", "invalid/name"),
+        ("with_name", ""),
+        ("with_suffix", "invalid"),
+        ("with_stem", "invalid/stem"),
+        ("with_stem", ""),
+    ])
+    def test_with_component_invalid(self, method, arg):
+        """Test with_name/with_suffix/with_stem with invalid inputs."""
+        p = _P_FILE_TXT
+        with pytest.raises(ValueError):
+            getattr(p, method)(arg)
+
+
+class TestFlexPathJoining:
     """Test path joining and combining operations."""
 
     def test_joinpath(self):
         """Test joinpath method."""
-        p = FlexPath("/home/user")
+        p = _P_HOME_USER
         joined = p.joinpath("docs", "file.txt")
-        self.assertEqual(str(joined), "/home/user/docs/file.txt")
+        assert str(joined) == "/home/user/docs/file.txt"
 
     def test_truediv_operator(self):
         """Test / operator for path joining."""
-        p = FlexPath("/home/user")
+        p = _P_HOME_USER
         joined = p / "docs" / "file.txt"
-        self.assertEqual(str(joined), "/home/user/docs/file.txt")
+        assert str(joined) == "/home/user/docs/file.txt"
+
+    @pytest.mark.parametrize("base,other,expected", [
+        ("", "x", "x"),
+        (".", "x", "x"),
+        ("/", "x", "/x"),
+        ("/home/user", "/abs", "/abs"),
+        ("/home/user", "", "/home/user"),
+        ("", "", ""),
+        (".", "", "."),
+        ("a/b", "../c", "a/c"),
+        ("/home/user", "docs/../x", "/home/user/x"),
+    ])
+    def test_truediv_edge_cases(self, base, other, expected):
+        """Test / with empty, dot, root and absolute operands."""
+        assert str(FlexPath(base) / other) == expected
 
     def test_rtruediv_operator(self):
         """Test reverse / operator."""
         p = FlexPath("docs/file.txt")
         joined = "/home/user" / p
-        self.assertEqual(str(joined), "/home/user/docs/file.txt")
+        assert str(joined) == "/home/user/docs/file.txt"
 
 
-class TestFlexPathConversions(unittest.TestCase):
+class TestFlexPathConversions:
     """Test path conversion methods."""
 
     def test_as_posix(self):
         """Test as_posix method."""
         p = FlexPath("/home\\user")  # Backslashes should be converted
-        self.assertEqual(p.as_posix(), "/home/user")
+        assert p.as_posix() == "/home/user"
 
     def test_as_uri(self):
         """Test as_uri method."""
         p = FlexPath("/home/user/file with spaces.txt")
         uri = p.as_uri()
-        self.assertTrue(uri.startswith("file://"))
-        self.assertIn("file%20with%20spaces.txt", uri)
+        assert uri.startswith("file://")
+        assert "file%20with%20spaces.txt" in uri
 
     def test_as_uri_relative_error(self):
         """Test as_uri with relative path raises error."""
         p = FlexPath("relative/path")
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             p.as_uri()
 
     def test_cwd(self):
         """Test cwd class method."""
         cwd = FlexPath.cwd()
-        self.assertTrue(cwd.is_absolute())
-        self.assertEqual(str(cwd), os.getcwd())
+        assert cwd.is_absolute()
+        assert str(cwd) == _CWD_STR
 
     def test_home(self):
         """Test home class method."""
         home = FlexPath.home()
-        self.assertTrue(home.is_absolute())
-        self.assertEqual(str(home), os.path.expanduser("~"))
+        assert home.is_absolute()
+        assert str(home) == _HOME_STR
 
 
-class TestFlexPathNormalization(unittest.TestCase):
+class TestFlexPathNormalization:
     """Test path normalization methods."""
 
     def test_expanduser(self):
         """Test expanduser method."""
         p = FlexPath("~/docs")
         expanded = p.expanduser()
-        self.assertTrue(str(expanded).startswith("/"))
+        assert str(expanded) == os.path.join(_HOME_STR, "docs")
 
     def test_absolute(self):
         """Test absolute method."""
         p = FlexPath("relative/path")
         abs_p = p.absolute()
-        self.assertTrue(abs_p.is_absolute())
+        assert abs_p.is_absolute()
 
     def test_is_absolute(self):
         """Test is_absolute method."""
-        abs_path = FlexPath("/home/user")
+        abs_path = _P_HOME_USER
         rel_path = FlexPath("home/user")
-        self.assertTrue(abs_path.is_absolute())
-        self.assertFalse(rel_path.is_absolute())
+        assert abs_path.is_absolute()
+        assert not rel_path.is_absolute()
 
     def test_relative_to(self):
         """Test relative_to method."""
         p = FlexPath("/home/user/docs/file.txt")
-        base = FlexPath("/home/user")
+        base = _P_HOME_USER
         rel = p.relative_to(base)
-        self.assertEqual(str(rel), "docs/file.txt")
+        assert str(rel) == "docs/file.txt"
 
     def test_relative_to_error(self):
         """Test relative_to with incompatible paths."""
-        p = FlexPath("/home/user/docs")
+        p = _P_DOCS
         base = FlexPath("/other/path")
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             p.relative_to(base)
 
     def test_is_relative_to(self):
         """Test is_relative_to method."""
         p = FlexPath("/home/user/docs/file.txt")
-        base = FlexPath("/home/user")
+        base = _P_HOME_USER
         other = FlexPath("/other/path")
-        self.assertTrue(p.is_relative_to(base))
-        self.assertFalse(p.is_relative_to(other))
+        assert p.is_relative_to(base)
+        assert not p.is_relative_to(other)
 
 
-class TestFlexPathFilesystem(unittest.TestCase):
+class TestFlexPathFilesystem:
     """Test filesystem operations with temporary files."""
 
-    def setUp(self):
-        """Set up temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setup_class(cls):
+        """Create one temporary root directory shared by the whole class."""
+        cls._root = tempfile.mkdtemp(dir=_SHM_DIR)
+
+    @classmethod
+    def teardown_class(cls):
+        """Clean up the shared temporary root directory."""
+        try:
+            _fast_rmtree(cls._root)
+        except OSError:
+            pass
+
+    def setup_method(self, method):
+        """Give each test its own unique, empty subdirectory of the shared root."""
+        self.temp_dir = os.path.join(self._root, uuid.uuid4().hex)
+        os.mkdir(self.temp_dir)
         self.temp_path = FlexPath(self.temp_dir)
-        self.platform = platform.system()
-
-    def tearDown(self):
-        """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_mkdir(self):
         """Test mkdir method."""
         new_dir = self.temp_path / "newdir"
         new_dir.mkdir()
-        self.assertTrue(new_dir.exists())
-        self.assertTrue(new_dir.is_dir())
+        _assert_is_dir(new_dir)
 
     def test_mkdir_parents(self):
         """Test mkdir with parents=True."""
         nested_dir = self.temp_path / "parent" / "child"
         nested_dir.mkdir(parents=True)
-        self.assertTrue(nested_dir.exists())
-        self.assertTrue(nested_dir.is_dir())
+        _assert_is_dir(nested_dir)
 
     def test_touch(self):
         """Test touch method."""
         test_file = self.temp_path / "testfile.txt"
         test_file.touch()
-        self.assertTrue(test_file.exists())
-        self.assertTrue(test_file.is_file())
+        _assert_is_reg(test_file)
+
+    def test_exists_and_type_checks(self):
+        """Test exists/is_file/is_dir on a file, a directory, and a missing path."""
+        _mkfiles(self.temp_dir, ["testfile.txt"])
+        test_file = FlexPath(os.path.join(self.temp_dir, "testfile.txt"))
+        assert test_file.exists()
+        assert test_file.is_file()
+        assert not test_file.is_dir()
+        assert self.temp_path.is_dir()
+        assert not (self.temp_path / "missing").exists()
 
     def test_write_read_text(self):
         """Test writing and reading text."""
@@ -415,7 +445,7 @@ class TestFlexPathFilesystem(unittest.TestCase):
         content = "Hello, World!"
         test_file.write_text(content)
         read_content = test_file.read_text()
-        self.assertEqual(content, read_content)
+        assert content == read_content
 
     def test_write_read_bytes(self):
         """Test writing and reading bytes."""
@@ -423,177 +453,186 @@ class TestFlexPathFilesystem(unittest.TestCase):
         content = b"Hello, World!"
         test_file.write_bytes(content)
         read_content = test_file.read_bytes()
-        self.assertEqual(content, read_content)
+        assert content == read_content
 
     def test_unlink(self):
         """Test unlink method."""
-        test_file = self.temp_path / "testfile.txt"
-        test_file.touch()
-        self.assertTrue(test_file.exists())
+        _mkfiles(self.temp_dir, ["testfile.txt"])
+        test_file = FlexPath(os.path.join(self.temp_dir, "testfile.txt"))
         test_file.unlink()
-        self.assertFalse(test_file.exists())
+        assert not os.path.lexists(test_file)
 
     def test_rmdir(self):
         """Test rmdir method."""
-        test_dir = self.temp_path / "testdir"
-        test_dir.mkdir()
-        self.assertTrue(test_dir.exists())
+        test_dir = FlexPath(os.path.join(self.temp_dir, "testdir"))
+        os.mkdir(test_dir)
         test_dir.rmdir()
-        self.assertFalse(test_dir.exists())
+        assert not os.path.lexists(test_dir)
 
     def test_rename(self):
         """Test rename method."""
-        old_file = self.temp_path / "oldfile.txt"
-        new_file = self.temp_path / "newfile.txt"
-        old_file.touch()
+        _mkfiles(self.temp_dir, ["oldfile.txt"])
+        old_file = FlexPath(os.path.join(self.temp_dir, "oldfile.txt"))
+        new_file = os.path.join(self.temp_dir, "newfile.txt")
         
         result = old_file.rename(new_file)
-        self.assertFalse(old_file.exists())
-        self.assertTrue(new_file.exists())
-        self.assertEqual(str(result), str(new_file))
+        assert not os.path.lexists(old_file)
+        _assert_is_reg(new_file)
+        assert str(result) == new_file
 
     def test_iterdir(self):
         """Test iterdir method."""
         # Create test files and directories
-        (self.temp_path / "file1.txt").touch()
-        (self.temp_path / "file2.txt").touch()
-        (self.temp_path / "subdir").mkdir()
+        _mkfiles(self.temp_dir, ["file1.txt", "file2.txt"])
+        os.mkdir(os.path.join(self.temp_dir, "subdir"))
         
-        items = list(self.temp_path.iterdir())
-        self.assertEqual(len(items), 3)
-        names = [item.name for item in items]
-        self.assertIn("file1.txt", names)
-        self.assertIn("file2.txt", names)
-        self.assertIn("subdir", names)
+        assert {p.name for p in self.temp_path.iterdir()} == {"file1.txt", "file2.txt", "subdir"}
+
+    def test_iterdir_errors(self):
+        """Test iterdir on a file and on a missing path."""
+        _mkfiles(self.temp_dir, ["file.txt"])
+        test_file = FlexPath(os.path.join(self.temp_dir, "file.txt"))
+        with pytest.raises(NotADirectoryError):
+            list(test_file.iterdir())
+        with pytest.raises(FileNotFoundError):
+            list((self.temp_path / "missing").iterdir())
 
     def test_glob(self):
         """Test glob method."""
         # Create test files
-        (self.temp_path / "file1.txt").touch()
-        (self.temp_path / "file2.txt").touch()
-        (self.temp_path / "file1.py").touch()
+        _mkfiles(self.temp_dir, ["file1.txt", "file2.txt", "file1.py"])
         
         txt_files = list(self.temp_path.glob("*.txt"))
-        self.assertEqual(len(txt_files), 2)
+        assert len(txt_files) == 2
         
         all_files = list(self.temp_path.glob("file*"))
-        self.assertEqual(len(all_files), 3)
+        assert len(all_files) == 3
+        
+        sorted_files = list(self.temp_path.glob("file*", sort=True))
+        assert sorted_files == sorted(all_files)
 
     def test_stat(self):
         """Test stat method."""
-        test_file = self.temp_path / "testfile.txt"
-        test_file.write_text("test content")
+        test_file = FlexPath(os.path.join(self.temp_dir, "testfile.txt"))
+        _write(test_file, b"test content")
         
         stat_result = test_file.stat()
-        self.assertTrue(stat.S_ISREG(stat_result.st_mode))
-        self.assertGreater(stat_result.st_size, 0)
+        assert stat.S_ISREG(stat_result.st_mode) and stat_result.st_size > 0
+
+    def test_file_type(self):
+        """Test file_type method and special-file checks."""
+        _mkfiles(self.temp_dir, ["testfile.txt"])
+        test_file = FlexPath(os.path.join(self.temp_dir, "testfile.txt"))
+        assert stat.S_ISREG(test_file.file_type())
+        assert stat.S_ISDIR(self.temp_path.file_type())
+        assert not test_file.is_fifo()
+        assert not test_file.is_socket()
+        
+        fifo = FlexPath(os.path.join(self.temp_dir, "fifo"))
+        os.mkfifo(fifo)
+        assert fifo.is_fifo()
+        assert not fifo.is_block_device()
+        
+        missing = FlexPath(os.path.join(self.temp_dir, "missing"))
+        assert not missing.is_char_device()
+        with pytest.raises(FileNotFoundError):
+            missing.file_type()
 
     def test_chmod(self):
         """Test chmod method."""
-        test_file = self.temp_path / "testfile.txt"
-        test_file.touch()
+        _mkfiles(self.temp_dir, ["testfile.txt"])
+        test_file = FlexPath(os.path.join(self.temp_dir, "testfile.txt"))
         
         # Change permissions
         test_file.chmod(0o644)
-        stat_result = test_file.stat()
         # Check that owner has read/write permissions
-        self.assertTrue(stat_result.st_mode & stat.S_IRUSR)
-        self.assertTrue(stat_result.st_mode & stat.S_IWUSR)
+        mask = stat.S_IRUSR | stat.S_IWUSR
+        assert os.stat(test_file).st_mode & mask == mask
 
-    @unittest.skipUnless(platform.system() == "Darwin", "macOS-specific test")
+    @pytest.mark.skipif(not _IS_DARWIN, reason="macOS-specific test")
     def test_macos_filesystem_operations(self):
         """Test filesystem operations specific to macOS."""
         # Test creating files in macOS-style temp directory
         test_file = self.temp_path / "macos_test.txt"
         test_file.write_text("Hello macOS!")
-        content = test_file.read_text()
-        self.assertEqual(content, "Hello macOS!")
+        assert test_file.read_text() == "Hello macOS!"
         
         # Test that temp directory follows macOS patterns
-        if self.platform == "Darwin":
-            temp_str = str(self.temp_path)
-            self.assertTrue(temp_str.startswith("/var/") or temp_str.startswith("/tmp"))
+        if _IS_DARWIN:
+            temp_str = self.temp_dir
+            assert temp_str.startswith("/var/") or temp_str.startswith("/tmp")
 
-    @unittest.skipUnless(platform.system() == "Darwin", "macOS-specific test")
+    @pytest.mark.skipif(not _IS_DARWIN, reason="macOS-specific test")
     def test_macos_symlinks(self):
         """Test symbolic link operations on macOS."""
-        source = self.temp_path / "source.txt"
-        link = self.temp_path / "link.txt"
+        source = os.path.join(self.temp_dir, "source.txt")
+        link = FlexPath(os.path.join(self.temp_dir, "link.txt"))
         
-        source.write_text("symlink test")
+        _write(source, b"symlink test")
         link.symlink_to(source)
         
-        self.assertTrue(link.is_symlink())
-        self.assertEqual(link.read_text(), "symlink test")
+        assert link.is_symlink()
+        assert link.read_text() == "symlink test"
         
         # Test readlink
         target = link.readlink()
-        self.assertEqual(str(target), str(source))
+        assert str(target) == source
 
-    @unittest.skipUnless(platform.system() == "Linux", "Linux-specific test")
+    @pytest.mark.skipif(not _IS_LINUX, reason="Linux-specific test")
     def test_linux_filesystem_operations(self):
         """Test filesystem operations specific to Linux."""
         # Test creating files in Linux-style temp directory
         test_file = self.temp_path / "linux_test.txt"
         test_file.write_text("Hello Linux!")
-        content = test_file.read_text()
-        self.assertEqual(content, "Hello Linux!")
+        assert test_file.read_text() == "Hello Linux!"
         
         # Test that temp directory follows Linux patterns
-        if self.platform == "Linux":
-            temp_str = str(self.temp_path)
-            self.assertTrue(temp_str.startswith("/tmp") or temp_str.startswith("/var/tmp"))
+        if _IS_LINUX:
+            temp_str = self.temp_dir
+            assert temp_str.startswith(("/tmp", "/var/tmp", "/dev/shm"))
 
 
-class TestFlexPathMatching(unittest.TestCase):
+class TestFlexPathMatching:
     """Test pattern matching methods."""
 
-    def test_match(self):
+    @pytest.mark.parametrize("path,pattern,expected", [
+        (_MATCH_PATH, "*.txt", True),
+        (_MATCH_PATH, "*/file.txt", True),
+        (_MATCH_PATH, "*.py", False),
+        # Matching is case sensitive
+        (_MATCH_PATH_UPPER, "*.txt", False),
+        (_MATCH_PATH_UPPER, "*.TXT", True),
+    ])
+    def test_match(self, path, pattern, expected):
         """Test match method."""
-        p = FlexPath("/home/user/file.txt")
-        self.assertTrue(p.match("*.txt"))
-        self.assertTrue(p.match("*/file.txt"))
-        self.assertFalse(p.match("*.py"))
-
-    def test_match_case_sensitive(self):
-        """Test match is case sensitive."""
-        p = FlexPath("/home/user/File.TXT")
-        self.assertFalse(p.match("*.txt"))
-        self.assertTrue(p.match("*.TXT"))
+        assert path.match(pattern) is expected
 
 
-class TestFlexPathEdgeCases(unittest.TestCase):
+class TestFlexPathEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_empty_path_operations(self):
-        """Test operations on empty paths."""
-        p = FlexPath("")
-        self.assertEqual(p.parts, ())
-        self.assertEqual(p.name, "")
-        self.assertEqual(p.suffix, "")
-        self.assertEqual(p.stem, "")
-
-    def test_root_path_operations(self):
-        """Test operations on root path."""
-        p = FlexPath("/")
-        self.assertEqual(p.parts, ("/",))
-        self.assertEqual(p.name, "/")
-        self.assertEqual(p.suffix, "")
-        self.assertEqual(p.stem, "/")
-        self.assertEqual(str(p.parent), "/")
-
-    def test_path_with_dots(self):
-        """Test paths with dot components."""
-        p = FlexPath("./dir/../file.txt")
-        # Should be normalized during construction
-        self.assertEqual(str(p), "file.txt")
-
-    def test_multiple_slashes(self):
-        """Test paths with multiple consecutive slashes."""
-        p = FlexPath("/home//user///file.txt")
-        # Should be normalized during construction
-        self.assertEqual(str(p), "/home/user/file.txt")
+    @pytest.mark.parametrize("path,expected_str,parts,name,suffix,stem,parent", [
+        # Empty path
+        ("", "", (), "", "", "", None),
+        # Root path
+        ("/", "/", ("/",), "/", "", "/", "/"),
+        # Dot components are normalized during construction
+        ("./dir/../file.txt", "file.txt", None, None, None, None, None),
+        # Consecutive slashes are normalized during construction
+        ("/home//user///file.txt", "/home/user/file.txt", None, None, None, None, None),
+    ])
+    def test_edge_case(self, path, expected_str, parts, name, suffix, stem, parent):
+        """Test empty, root, dotted and multi-slash paths."""
+        p = FlexPath(path)
+        assert str(p) == expected_str
+        if parts is not None:
+            assert p.parts == parts
+            assert p.name == name
+            assert p.suffix == suffix
+            assert p.stem == stem
+        if parent is not None:
+            assert str(p.parent) == parent
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])